@@ -1,3 +1,4 @@
+from collections import deque
 from typing import List, Optional, Tuple
 
 from torch import nn
@@ -24,33 +25,34 @@ class ProcessingGrid(nn.Module):
         for submodel in units:
             final_list.append(nn.ModuleList(submodel))
         self.module_grid = nn.ModuleList(final_list)
-        self.linear_grid = [[None] * len(final_list[0]) for _ in final_list]
-        self.orthogonal_grid = [[None] * len(final_list[0]) for _ in final_list]
+        self.linear_grid = deque([[None] * len(final_list[0]) for _ in final_list], maxlen=len(final_list))
+        self.orthogonal_grid = deque([[None] * len(final_list[0]) for _ in final_list], maxlen=len(final_list))
+
+        # The order in which the grid is worked through never changes. Lay it out once
+        self.schedule = [(i, j, unit) for i, submodel in enumerate(self.module_grid)
+                         for j, unit in enumerate(submodel)]
 
     def forward(self,
                 linear_input: List[Optional[torch.Tensor]],
                 orthogonal_input: List[Optional[torch.Tensor]]):
 
-        # Peform update propogation
-        self.linear_grid.insert(0, linear_input)
+        # Peform update propogation. Pop first, so the bounded deque never discards a row
         linear_output = self.linear_grid.pop()
+        self.linear_grid.appendleft(linear_input)
 
-        self.orthogonal_grid.insert(0, orthogonal_input)
         orthogonal_output = self.orthogonal_grid.pop()
+        self.orthogonal_grid.appendleft(orthogonal_input)
 
         # Work through the grid
-        for i, submodel in enumerate(self.module_grid):
-            for j, unit in enumerate(submodel):
-                linear = self.linear_grid[i][j]
-                orthogonal = self.orthogonal_grid[j][i]
-                if linear is not None and orthogonal is not None:
-                    assert linear.batch == orthogonal.batch
-                    assert linear.signals == orthogonal.signals
-                    outcome = unit(linear, orthogonal, signals)
-                    linear = outcome
-                    orthogonal = outcome
-                self.linear_grid[i][j] = linear
-                self.orthogonal_grid[j][i] = orthogonal
+        for i, j, unit in self.schedule:
+            linear = self.linear_grid[i][j]
+            orthogonal = self.orthogonal_grid[j][i]
+            if linear is not None and orthogonal is not None:
+                assert linear.batch == orthogonal.batch
+                assert linear.signals == orthogonal.signals
+                outcome = unit(linear, orthogonal, signals)
+                self.linear_grid[i][j] = outcome
+                self.orthogonal_grid[j][i] = outcome
 
         # Return the finished items
         return linear_output, orthogonal_output
@@ -76,10 +78,10 @@ class SuperEnsemble(nn.Module):
 
         super().__init__()
 
-        self.starters = Start
-        self.res = ResStart
-        self.teardown = TearDown
-        self.submodels = SubModels
+        self.starters = nn.ModuleList(Start)
+        self.res = nn.ModuleList(ResStart)
+        self.teardown = nn.ModuleList(TearDown)
+        self.submodels = nn.ModuleList(SubModels)
 
     def forward(self,
                 input_stream: StreamTensor,
@@ -99,8 +101,8 @@ class SuperEnsemble(nn.Module):
             of residual information.
         """
         #Strip out stream losses, metrics. Put them in null stream, to merge into the output later.
-        null_stream = input_stream.keeponly([]) #Only keeps metrics, losses.
-        input_stream = input_stream.branch(input_stream.names)
+        #Both halves are views onto the original stream, so nothing is copied.
+        input_stream, null_stream = input_stream.split_metrics_view()
 
         #Preprocess, start tensors for ensemble
         if ensemble_streams is not None:
@@ -121,7 +123,8 @@ class SuperEnsemble(nn.Module):
             output, residuals = submodel(substream, auxiliary_stream)
             outputs.append(output)
 
-        #collapse the accumulated ensemble
+        #collapse the accumulated ensemble. Each teardown boosts on the cumulative result
+        #of the one before it, so they must run in order.
         ensemble_items: List[StreamTensor] = []
         cumulative: Optional[StreamTensor] = None
         for output, final in zip(outputs, self.teardown):
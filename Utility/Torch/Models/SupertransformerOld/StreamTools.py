@@ -392,6 +392,18 @@ class StreamTensor():
             new_stream[name] = self.stream[name]
 
         return StreamTensor(new_stream, None, None, None)
+    def split_metrics_view(self) -> Tuple[StreamTensor, StreamTensor]:
+        """
+        Separates the stream from the losses, metrics, and residuals. Both
+        halves share the dictionaries of this stream, and should be treated
+        as read only.
+
+        :return: A StreamTensor holding only the stream, and a StreamTensor
+            holding only the losses, metrics, and residuals.
+        """
+        stream = StreamTensor(self._stream, None, None, None)
+        null_stream = StreamTensor(None, self._losses, self._metrics, self._residuals)
+        return stream, null_stream
     def discard(self, names: List[str]) -> StreamTensor:
         """
         Discards from the stream the items with the indicated names. This
@@ -0,0 +1,37 @@
+"""
+
+Tests for the StreamTensor operations SuperEnsemble relies on to
+separate a stream from its losses and metrics without copying.
+
+
+"""
+import torch
+import unittest
+
+from Utility.Torch.Models.SupertransformerOld import StreamTools
+
+
+class test_stream_views(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_stream = {"channel1" : torch.randn([10, 20, 4]),
+                       "channel2" : torch.randn([30, 20])}
+        self.test_losses = {"loss1" : torch.randn(1)}
+        self.test_metrics = {"metric1": [torch.randn([20, 3])]}
+
+    def test_split_metrics_view(self):
+        """ Tests the stream and the metrics can be separated without copying"""
+        tensor = StreamTools.StreamTensor(self.test_stream, self.test_losses, self.test_metrics)
+        stream_tensor, null_tensor = tensor.split_metrics_view()
+        self.assertTrue(stream_tensor.stream is tensor.stream)
+        self.assertTrue(stream_tensor.losses == {})
+        self.assertTrue(stream_tensor.metrics == {})
+        self.assertTrue(null_tensor.stream == {})
+        self.assertTrue(null_tensor.losses is tensor.losses)
+        self.assertTrue(null_tensor.metrics is tensor.metrics)
+    def test_branch_duplicate_names(self):
+        """ Tests a branch naming the same channel twice keeps only that channel"""
+        tensor = StreamTools.StreamTensor(self.test_stream, self.test_losses, self.test_metrics)
+        branch_tensor = tensor.branch(['channel1', 'channel1'])
+        self.assertTrue(list(branch_tensor.stream.keys()) == ['channel1'])
+        self.assertTrue(branch_tensor.losses == {})
+        self.assertTrue(branch_tensor.metrics == {})
@@ -12,20 +12,19 @@ class Gardener():
 
 
     """
+    @property
+    def _sparameters(self):
+        #Find and collect all the sparse parameters in the model. This is only
+        #done the first time they are needed.
+        if self._sparameter_cache is None:
+            modules = self._model.modules()
+            self._sparameter_cache = tuple(item for item in modules if isinstance(item, SparseParameter))
+        return self._sparameter_cache
+
     def __init__(self,
                  model: nn.Module
                  ):
-        #Find and collect all the sparse parameters in the model.
-        SparseParams = []
-        for item in model.modules():
-            if isinstance(item, SparseParameter):
-                SparseParams.append(item)
-        #Find and collect all the nonsparse parameters in the model
-        Params = list(model.parameters())
 
         #Store
-        self._sparameters = SparseParams
-        self._parameters = Params
-
-
-
+        self._model = model
+        self._sparameter_cache = None
@@ -23,15 +23,21 @@ class SparseParameter(nn.Module):
 
     """
 
+    @property
+    def active_index(self):
+        return self._slots[:self._num_active]
+    @property
+    def inactive_index(self):
+        return self._slots[self._num_active:]
     @property
     def total_active(self):
-        return self.active_index.shape[0]
+        return self._num_active
     @property
     def total_inactive(self):
-        return self.inactive_index.shape[0]
+        return self._slots.shape[0] - self._num_active
     @property
     def total_param_space(self):
-        return self.inactive_index + self.active_index
+        return self._slots.shape[0]
 
     @classmethod
     def from_sparse(cls,
@@ -69,10 +75,6 @@ class SparseParameter(nn.Module):
         #Grow the initial tensor, then return the parameter
         item.grow_(row=row, col=col, value=value)
         return item
-    def from_tensor(self,
-                    tensor: torch.Tensor,
-                    mask: torch.Tensor,
-                    max_sparsity: float):
     def prune_(self,
                threshold: Optional[float] = None,
                rel_percentage: Optional[float] = None,
@@ -127,38 +129,44 @@ class SparseParameter(nn.Module):
         value = self.sparse.storage.value()
         row = self.sparse.storage.row()
         col = self.sparse.storage.col()
+        abs_value = torch.abs(value)
 
-        # Get the number of nonpassing values.
-        if rel_percentage is not None:
-            num_failed = round(rel_percentage / 100. * value.shape[0])
-        elif threshold is not None:
-            threshold_result = torch.abs(value) > threshold
-            num_failed = threshold_result.numel() - threshold_result.sum()
-        elif abs_percentage is not None:
-            num_required_inactive = round(abs_percentage / 100. * self.total_param_space)
-            diff = num_required_inactive - self.total_inactive
-            num_failed = max(diff, 0)  # Do not go reactivating things.
+        # Find the passing values. A threshold is a straight mask. The percentage modes only
+        # need to know which are the num_failed smallest values, which topk finds without a full sort.
+        if threshold is not None:
+            passed = abs_value > threshold
         else:
-            raise RuntimeError("This should not be possible.")
-
-        # Perform an index sort. Strip it apart into the failing and passing sections.
-        sorted_results = torch.argsort(torch.abs(value))
-        failed_indices, passed_indices = sorted_results[:num_failed], sorted_results[num_failed:]
+            if rel_percentage is not None:
+                num_failed = round(rel_percentage / 100. * value.shape[0])
+            elif abs_percentage is not None:
+                num_required_inactive = round(abs_percentage / 100. * self.total_param_space)
+                diff = num_required_inactive - self.total_inactive
+                num_failed = max(diff, 0)  # Do not go reactivating things.
+            else:
+                raise RuntimeError("This should not be possible.")
+
+            failed = torch.topk(abs_value, k=int(num_failed), largest=False, sorted=False).indices
+            passed = torch.ones_like(abs_value, dtype=torch.bool)
+            passed[failed] = False
+
+        # Strip the mask apart into the failing and passing sections.
+        failed_indices = torch.logical_not(passed).nonzero(as_tuple=True)[0]
+        passed_indices = passed.nonzero(as_tuple=True)[0]
 
         # Go and update the parameter index tracker regarding what parameters are active
-        # and what ones have failed. Do this by pulling
-
-        active_param_pass = self.active_index[passed_indices]
-        active_param_fail = self.active_index[failed_indices]
+        # and what ones have failed. Do this by rewriting the active section of the slot buffer
+        # in place as passing then failing, and dropping the watermark onto the boundary.
 
-        self.active_index = active_param_pass
-        self.inactive_index = torch.concat([self.inactive_index, active_param_fail], dim=0)
+        reordering = torch.cat([passed_indices, failed_indices], dim=0)
+        self._slots[:self._num_active] = self.active_index[reordering]
+        self._num_active = passed_indices.shape[0]
 
-        # Go slice out row, col, value information and update the sparse storage.
+        # Go slice out row, col, value information and update the sparse storage. index_select
+        # is a single gather kernel, and avoids the setup general advanced indexing goes through.
 
-        new_rows = row[passed_indices]
-        new_cols = col[passed_indices]
-        new_values = value[passed_indices]
+        new_rows = torch.index_select(row, 0, passed_indices)
+        new_cols = torch.index_select(col, 0, passed_indices)
+        new_values = torch.index_select(value, 0, passed_indices)
         self.sparse = torch_sparse.SparseTensor(row=new_rows, col=new_cols, value=new_values)
 
     def grow_(self,
@@ -230,15 +238,15 @@ class SparseParameter(nn.Module):
                 else:
                     raise IndexError("Insufficient parameters to grow for vector of length %s" % sparse_length)
 
-            # Reactivate needed additional parameters
+            # Reactivate needed additional parameters. The next inactive slots already sit
+            # directly after the active ones, so this only moves the watermark.
 
             length = sparse_length
-            newly_active, remaining_inactive = self.inactive_index[:length], self.inactive_index[length:]
-            self.active_index = torch.concat([self.active_index, newly_active])
-            self.inactive_index = remaining_inactive
+            newly_active = self.inactive_index[:length]
+            self._num_active += length
 
-            self.backend[newly_active] = value  # setup parameter
-            value = self.backend[newly_active]  # get parameterized version
+            self.value[newly_active] = value  # setup parameter
+            value = self.value[newly_active]  # get parameterized version
 
             # Construct new sparse representation. Update
 
@@ -247,11 +255,9 @@ class SparseParameter(nn.Module):
                 old_col = self.sparse.storage.col()
                 old_val = self.sparse.storage.value()
 
-                row = torch.concat([old_row, row])
-                col = torch.concat([old_col, col])
-                value = torch.concat([old_val, value])
-
-                print(row)
+                row = torch.cat([old_row, row])
+                col = torch.cat([old_col, col])
+                value = torch.cat([old_val, value])
 
             self.sparse = torch_sparse.SparseTensor(row=row, col=col, value=value)
 
@@ -269,9 +275,14 @@ class SparseParameter(nn.Module):
         index = self.index
         value = self.value[:index.shape[0]]
         self.sparse= torch_sparse.SparseTensor(
-                                                row=index[0],
-                                                col=index[1],
+                                                row=index[:, 0],
+                                                col=index[:, 1],
                                                 value=value)
+    def get_extra_state(self):
+        """ The watermark is a python int, so it is saved alongside the buffers here"""
+        return {"num_active": self._num_active}
+    def set_extra_state(self, state):
+        self._num_active = state["num_active"]
     def __init__(
             self,
             reservation: int,
@@ -310,5 +321,12 @@ class SparseParameter(nn.Module):
                                     requires_grad=requires_grad,
                                     )
         self.index = torch.empty([0, 2],dtype=torch.int64, device=device)
+
+        # Every reserved parameter slot lives in a single preallocated buffer. Slots before
+        # the watermark are active, and those after it are inactive. The buffer is registered
+        # so it follows the module across devices and into the state dict.
+        self.register_buffer('_slots', torch.arange(reservation, dtype=torch.int64, device=device))
+        self._num_active = 0
+        self.suppressing_grow_warning = False
         self._build()
 
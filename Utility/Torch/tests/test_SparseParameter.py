@@ -0,0 +1,67 @@
+"""
+
+Test the slot bookkeeping of the
+sparse parameter module
+
+"""
+
+import unittest
+import torch
+
+from Utility.Torch.Sparse.Parameter import SparseParameter
+
+
+class test_SparseParameter(unittest.TestCase):
+    """
+    Test that grow_ and prune_ keep the active and inactive
+    slots consistent with one another.
+    """
+    def test_grow_prune_grow(self):
+        """ Tests the slot buffer through a grow, prune, grow cycle"""
+        param = SparseParameter(10)
+        self.assertTrue(param.total_active == 0)
+        self.assertTrue(param.total_inactive == 10)
+
+        row = torch.tensor([0, 1, 2, 3])
+        col = torch.tensor([0, 1, 2, 3])
+        value = torch.tensor([1.0, 0.1, 2.0, 0.05])
+        param.grow_(row, col, value)
+
+        self.assertTrue(param.active_index.tolist() == [0, 1, 2, 3])
+        self.assertTrue(param.inactive_index.tolist() == [4, 5, 6, 7, 8, 9])
+        self.assertTrue(param.total_active == 4)
+        self.assertTrue(param.total_inactive == 6)
+
+        # Slots 1 and 3 hold values under the threshold. They should be freed, and sit
+        # at the front of the inactive section.
+        param.prune_(threshold=0.5)
+
+        self.assertTrue(param.active_index.tolist() == [0, 2])
+        self.assertTrue(param.inactive_index.tolist() == [1, 3, 4, 5, 6, 7, 8, 9])
+        self.assertTrue(param.total_active == 2)
+        self.assertTrue(param.total_inactive == 8)
+
+        row = torch.tensor([4, 5, 6])
+        col = torch.tensor([4, 5, 6])
+        param.grow_(row, col, 1.0)
+
+        self.assertTrue(param.active_index.tolist() == [0, 2, 1, 3, 4])
+        self.assertTrue(param.inactive_index.tolist() == [5, 6, 7, 8, 9])
+        self.assertTrue(param.total_active == 5)
+        self.assertTrue(param.total_inactive == 5)
+        self.assertTrue(param.total_param_space == 10)
+    def test_state_dict(self):
+        """ Tests the slots and watermark are saved and restored with the module"""
+        param = SparseParameter(10)
+        param.grow_(torch.tensor([0, 1, 2]), torch.tensor([0, 1, 2]), torch.tensor([1.0, 0.1, 2.0]))
+        param.prune_(threshold=0.5)
+
+        state = param.state_dict()
+        self.assertTrue('_slots' in state)
+
+        restored = SparseParameter(10)
+        restored.load_state_dict(state)
+        self.assertTrue(restored.active_index.tolist() == [0, 2])
+        self.assertTrue(restored.inactive_index.tolist() == [1, 3, 4, 5, 6, 7, 8, 9])
+        self.assertTrue(restored.total_active == 2)
+        self.assertTrue(restored.total_inactive == 8)
@@ -14,6 +14,14 @@ class testView(unittest.TestCase):
         Glimpses.reshape(test_tensor, [30, 10], [50, 6])
         Glimpses.reshape(test_tensor, torch.tensor([30, 10]), torch.tensor([50, 6]))
         Glimpses.reshape(test_tensor, torch.tensor([30, 10]), torch.tensor([50, 6], dtype=torch.int32))
+    def testStrided(self):
+        """ Tests whether view works on a noncontiguous tensor, such as produced by local """
+        test_tensor = torch.arange(20).view(2, 10)
+        localized = Glimpses.local(test_tensor, 3, 1, 2)
+        final = localized.contiguous().view(2, 18)
+
+        test = Glimpses.view(localized, [6, 3], 18)
+        self.assertTrue(torch.all(test == final), "Logical failure: strided view did not match")
 
 
 class testLocal(unittest.TestCase):
@@ -137,6 +145,19 @@ class testLocal(unittest.TestCase):
         self.assertTrue(output.shape[-2] == 8)
         output = Glimpses.local(test_tensor, 4, 4, 1)
         self.assertTrue(output.shape[-2] == 4)
+    def testStartOffsetOnly(self):
+        """ Test that kernels stay within the offset region when only a start offset is given """
+        tensor = torch.arange(20).view(2, 10)
+        kernel, striding, dilation = 2, 2, 2
+
+        final = []
+        final.append([[2, 4], [4, 6], [6, 8]])
+        final.append([[12, 14], [14, 16], [16, 18]])
+        final = torch.tensor(final)
+
+        test = Glimpses.local(tensor, kernel, striding, dilation, start_offset=2)
+        self.assertTrue(test.shape == final.shape)
+        self.assertTrue(torch.all(final == test), "Logical failure: offset issues")
 
 
 class testDilocal(unittest.TestCase):
@@ -9,6 +9,7 @@ do something with it. They also tend to return views to allow efficient memory u
 The current functions available are.
 
 view
+reshape
 local
 
 
@@ -19,75 +20,28 @@ from torch.nn import functional as F
 from typing import Union, Sequence, List, Tuple
 
 @torch.jit.script
-def view(tensor,
-         input_shape: Union[torch.Tensor, List[int], int],
-         output_shape: Union[torch.Tensor, List[int], int]) -> torch.Tensor:
-    """
-    This will, when passed an input shape and compatible output shape, assume that said shapes
-    refer to the later dimensions in a tensor, as in broadcasting, and will perform a reshape from
-    input shape to output shape while keeping all other dimensions exactly the same.
-
-
-    ---- parameters ---
-
-    :param tensor:
-        The tensor to be modified.
-    :param input_shape:
-        The expected input shape. This can be a list/tuple of ints, or an int. It should represent the shape at the end
-        of the input tensor's .shape which will be matched in the tensor input
-    :param output_shape:
-        The expected output shape. This can be a list/tuple of ints, or an int. It should represent the final shape one
-        wishes the tensor to take. It also must be the case that the total size of the input and output shape must be the same.
-    ---- Examples ----
-
-
-    For tensors of shape:
-
-    a = (5,2), b=(3, 4, 5,2), c=(30, 5,2),
-
-    For input_shape = (5,2), output_shape=10, one has
-
-    f(a, input_shape, output_shape) = shape(10)
-    f(b, input_shape, output_shape) = shape(3, 4, 10)
-    f(c, input_shape, output_shape) = shape(30, 10)
-
-
-    """
-
-    # Raw Type converison. The goal here is to end up with something solely
-    # in terms of tensors.
-
-    if torch.jit.isinstance(input_shape, int):
-        input_shape = [input_shape]
-    if torch.jit.isinstance(output_shape, int):
-        output_shape = [output_shape]
-
-    if torch.jit.isinstance(input_shape, List[int]):
-        input_shape = torch.tensor(input_shape, dtype=torch.int64)
-    if torch.jit.isinstance(output_shape, List[int]):
-        output_shape = torch.tensor(output_shape, dtype=torch.int64)
-
-    torch.jit.annotate(torch.Tensor, input_shape)
-    torch.jit.annotate(torch.Tensor, output_shape)
-
-    # Basic sanity testing
-    assert input_shape.prod() == output_shape.prod()\
-        , "Shapes incompatible: Input shape and output shape were not compatible: "
-
-    #Perform view action.
-    slice_length: int = len(input_shape)
-    static_shape: torch.Tensor = torch.tensor(tensor.shape[:-slice_length], dtype=torch.int64)
-
-    final_shape: torch.Tensor = torch.concat([static_shape, output_shape])
-    final_shape: List[int] = final_shape.tolist()
+def _as_shape(shape: Union[torch.Tensor, List[int], int]) -> List[int]:
+    """ Converts an int, list of ints, or 1d tensor into a list of ints"""
+    if torch.jit.isinstance(shape, int):
+        return [shape]
+    if torch.jit.isinstance(shape, List[int]):
+        return shape
+    assert torch.jit.isinstance(shape, torch.Tensor)
+    output: List[int] = shape.to(torch.int64).tolist()
+    return output
 
-    output: torch.Tensor = tensor.reshape(final_shape)
+@torch.jit.script
+def _product(shape: List[int]) -> int:
+    """ The total number of elements a shape refers to"""
+    output = 1
+    for dim in shape:
+        output = output * dim
     return output
 
 @torch.jit.script
-def reshape(tensor,
-            input_shape: Union[torch.Tensor, List[int], int],
-            output_shape: Union[torch.Tensor, List[int], int]) -> torch.Tensor:
+def view(tensor,
+         input_shape: Union[torch.Tensor, List[int], int],
+         output_shape: Union[torch.Tensor, List[int], int]) -> torch.Tensor:
     """
     This will, when passed an input shape and compatible output shape, assume that said shapes
     refer to the later dimensions in a tensor, as in broadcasting, and will perform a reshape from
@@ -121,35 +75,32 @@ def reshape(tensor,
     """
 
     # Raw Type converison. The goal here is to end up with something solely
-    # in terms of tensors.
+    # in terms of python ints, so the shape math never touches a tensor.
 
-    if torch.jit.isinstance(input_shape, int):
-        input_shape = [input_shape]
-    if torch.jit.isinstance(output_shape, int):
-        output_shape = [output_shape]
-
-    if torch.jit.isinstance(input_shape, List[int]):
-        input_shape = torch.tensor(input_shape, dtype=torch.int64)
-    if torch.jit.isinstance(output_shape, List[int]):
-        output_shape = torch.tensor(output_shape, dtype=torch.int64)
-
-    torch.jit.annotate(torch.Tensor, input_shape)
-    torch.jit.annotate(torch.Tensor, output_shape)
+    input_shape: List[int] = _as_shape(input_shape)
+    output_shape: List[int] = _as_shape(output_shape)
 
     # Basic sanity testing
-    assert input_shape.prod() == output_shape.prod()\
+    assert _product(input_shape) == _product(output_shape)\
         , "Shapes incompatible: Input shape and output shape were not compatible: "
 
-    #Perform view action.
     slice_length: int = len(input_shape)
-    static_shape: torch.Tensor = torch.tensor(tensor.shape[:-slice_length], dtype=torch.int64)
+    assert tensor.shape[-slice_length:] == input_shape\
+        , "Shapes incompatible: Input shape did not match the end of the tensor shape"
 
-    final_shape: torch.Tensor = torch.concat([static_shape, output_shape])
-    final_shape: List[int] = final_shape.tolist()
+    # Nothing to do if the shape is already correct, as when a single dimension is flattened
+    if input_shape == output_shape:
+        return tensor
 
+    #Perform view action.
+    final_shape: List[int] = tensor.shape[:-slice_length] + output_shape
     output: torch.Tensor = tensor.reshape(final_shape)
     return output
 
+# Reshape is the same operation under its other name. Sharing the one compiled
+# function keeps the two from drifting apart.
+reshape = view
+
 def local(tensor: torch.Tensor,
           kernel_width: int,
           stride_rate: int,
@@ -199,28 +150,21 @@ def local(tensor: torch.Tensor,
     assert effective_length >= dilated_kernel_width, \
         ("With given start and end offset insufficient material remains for kernel", effective_length, dilated_kernel_width)
 
-    effective_length = effective_length - dilated_kernel_width
-    final_index_shape = (effective_length + stride_rate)// stride_rate  # Perform striding correction.
-
-    static_shape = torch.tensor(tensor.shape[:-1], dtype=torch.int64)
-    dynamic_shape = torch.tensor((final_index_shape, kernel_width), dtype=torch.int64)
-    final_shape = torch.concat([static_shape, dynamic_shape])
-
-    # Construct the stride. The main worry here is to ensure that the dilation striding, and primary
-    # striding, now occurs at the correct rate. This is done by taking the current one, multiplying,
-    # and putting this in the appropriate location.
-
-    input_stride = [tensor.stride(dim) for dim in range(tensor.dim())] #Workaround for bad typing on Tensor.stride
-
-    static_stride = torch.tensor(input_stride[:-1], dtype=torch.int64)
-    dynamic_stride = torch.tensor((stride_rate * input_stride[-1], dilation_rate * input_stride[-1]), dtype=torch.int64)
-    final_stride = torch.concat([static_stride, dynamic_stride])
-
-    # perform extraction. Return result
-
-    final_shape: List[int] = final_shape.tolist()
-    final_stride: List[int] = final_stride.tolist()
-    return tensor[..., start_offset:-end_offset].as_strided(final_shape, final_stride)
+    # Extract the kernels. Everything here is a view built by narrow and unfold, which
+    # check their bounds against the tensor they are called on. Building the strides by
+    # hand with as_strided does not, and on a sliced input will happily read past the end
+    # of the slice into neighboring memory.
+    #
+    # A dilated kernel spans dilated_kernel_width elements, so windows of that width are
+    # unfolded at the stride rate and then every dilation_rate-th tap is kept. The number of
+    # windows is (effective_length - dilated_kernel_width)//stride_rate + 1.
+
+    window = tensor.narrow(-1, start_offset, effective_length)
+    if kernel_width == 1 and stride_rate == 1:
+        return window.unsqueeze(-1)
+    if dilation_rate == 1:
+        return window.unfold(-1, kernel_width, stride_rate)
+    return window.unfold(-1, dilated_kernel_width, stride_rate)[..., ::dilation_rate]
 
 @torch.jit.script
 def dilocal(tensor: torch.Tensor,
@@ -288,9 +232,13 @@ def dilocal(tensor: torch.Tensor,
         start_offsets = particular_total_offsets - end_offsets
     pad_op = (prior_padding, post_padding)
 
-    #Create the buffer, then create and stack the views.
+    #Create the buffer, then create and stack the views. A padding of nothing
+    #would still make F.pad copy the whole tensor, so views are taken off the input directly.
 
-    buffer = F.pad(tensor, pad_op, value=pad_value)
+    if prior_padding == 0 and post_padding == 0:
+        buffer = tensor
+    else:
+        buffer = F.pad(tensor, pad_op, value=pad_value)
     local_views = []
     for dilation, start_offset, end_offset in zip(dilations, start_offsets, end_offsets):
         view_item = local(buffer, kernel_width, stride_rate, dilation, start_offset, end_offset)
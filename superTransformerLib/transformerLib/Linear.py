@@ -104,13 +104,21 @@ class Linear(nn.Module):
         self._input_shape = input_shape
         self._output_shape = output_shape
 
+        # The reshapes in forward see the same shapes every call. Resolve them to
+        # python ints once here, rather than converting tensors on every call.
+
+        self._input_dims: List[int] = input_shape.tolist()
+        self._output_dims: List[int] = output_shape.tolist()
+        self._input_width = int(input_shape.prod())
+        self._output_width = int(output_shape.prod())
+
         self._kernel = nn.Parameter(kernel)
         self._bias = nn.Parameter(bias)
     def forward(self, tensor):
 
         # Flatten the relevent dimensions
 
-        tensor = Glimpses.reshape(tensor, self._input_shape, int(self._input_shape.prod()))
+        tensor = Glimpses.reshape(tensor, self._input_dims, self._input_width)
 
         # Perform primary processing. Add an extra dimension on the end
         # of the input tensor to handle the matrix multiply, perform
@@ -122,7 +130,7 @@ class Linear(nn.Module):
         tensor = tensor + self._bias
 
         # Restore the dimensions, then return
-        tensor = Glimpses.reshape(tensor, int(self._output_shape.prod()), self._output_shape)
+        tensor = Glimpses.reshape(tensor, self._output_width, self._output_dims)
         return tensor
 
 